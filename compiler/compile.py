@@ -14,13 +14,33 @@ Usage:
 """
 
 import argparse
+import contextlib
+import functools
+import io
 import json
+import logging
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
 from pathlib import Path
 from string import Template
+from typing import Optional, Union
 import shutil
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to the standard library parser
+    orjson = None
+
+try:
+    import fastjsonschema
+except ImportError:  # optional: fall back to checking required fields only
+    fastjsonschema = None
+
+log = logging.getLogger("compile")
+
 # Configuration
 BASE_DIR = Path(__file__).parent.parent
 AGENTS_DIR = BASE_DIR / "agents"
@@ -29,6 +49,13 @@ COMMANDS_DIR = BASE_DIR / "commands"
 OUTPUT_DIR = BASE_DIR / "output"
 TEMPLATES_DIR = Path(__file__).parent / "templates"
 SCHEMA_DIR = Path(__file__).parent / "schema"
+# Input stamps of the last successful build, used to skip unchanged entities.
+# Kept outside output/, which is published as-is to the output-* branches.
+BUILD_CACHE_FILE = BASE_DIR / ".compile-cache.json"
+
+# orjson parses bytes directly; json.loads accepts bytes as well. Both raise a
+# json.JSONDecodeError (orjson.JSONDecodeError subclasses it).
+_json_loads = orjson.loads if orjson is not None else json.loads
 
 # Provider output paths
 PROVIDER_PATHS = {
@@ -37,37 +64,195 @@ PROVIDER_PATHS = {
     "copilot": OUTPUT_DIR / ".github",
 }
 
+# Providers compiled when none are requested (agents and commands / skills)
+_DEFAULT_AGENT_PROVIDERS = ("claude", "opencode", "copilot")
+_DEFAULT_SKILL_PROVIDERS = ("claude", "opencode")
 
+# Per-provider output directories as plain strings; output file paths are
+# built from these with f-strings instead of chained Path arithmetic.
+_PROV_AGENT_DIR = {p: str(path / "agents") for p, path in PROVIDER_PATHS.items()}
+_PROV_COMMAND_DIR = {p: str(path / "commands") for p, path in PROVIDER_PATHS.items()}
+_PROV_SKILLS_DIR = {p: str(path / "skills") for p, path in PROVIDER_PATHS.items()}
+
+
+def compile_template(text, filename="<template>"):
+    """Compile ``string.Template`` source text into a render(context) function.
+
+    The placeholders are located once and the template is turned into a
+    single f-string expression, so rendering is plain dict lookups instead of
+    a regex scan per call. Missing keys raise KeyError, like substitute();
+    filename is used for the generated code so tracebacks name the template.
+    render.keys is the frozenset of placeholder names the template uses.
+    """
+    parts = []
+    keys = set()
+    pos = 0
+    for match in Template.pattern.finditer(text):
+        if match.start() > pos:
+            parts.append(repr(text[pos : match.start()]))
+        key = match.group("named") or match.group("braced")
+        if key:
+            keys.add(key)
+            parts.append(f'f"{{ctx[{key!r}]}}"')
+        elif match.group("escaped") is not None:
+            parts.append(repr(Template.delimiter))
+        else:
+            i = match.start("invalid")
+            lines = text[:i].splitlines(keepends=True) or [""]
+            colno = i - len("".join(lines[:-1])) or 1
+            raise ValueError(
+                f"Invalid placeholder in template: line {len(lines)}, col {colno}"
+            )
+        pos = match.end()
+    if pos < len(text) or not parts:
+        parts.append(repr(text[pos:]))
+
+    source = "def render(ctx):\n    return " + " ".join(parts) + "\n"
+    namespace = {}
+    exec(compile(source, filename, "exec"), namespace)
+    render = namespace["render"]
+    render.keys = frozenset(keys)
+    return render
+
+
+@functools.lru_cache(maxsize=None)
 def load_template(template_name, template_type="agents"):
-    """Load a template file."""
+    """Load a template file and compile it (once per process)."""
     template_path = TEMPLATES_DIR / template_type / template_name
-    if not template_path.exists():
-        print(f"Error: Template not found: {template_path}")
-        sys.exit(1)
-    return Template(template_path.read_text())
+    try:
+        text = template_path.read_text()
+    except FileNotFoundError:
+        # SystemExit carries the message, so it is still reported when raised
+        # inside a render_all worker process.
+        raise SystemExit(f"Error: Template not found: {template_path}") from None
+    return compile_template(text, f"<template {template_path}>")
+
+
+def list_json_files(directory):
+    """Return the *.json files directly inside directory, sorted by name.
+
+    Uses os.scandir so the file-type check comes from the directory entry
+    instead of a separate stat per path.
+    """
+    with os.scandir(directory) as entries:
+        return sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(".json") and entry.is_file()
+        )
+
+
+def scan_dir(directory):
+    """Return (subdirectories, *.json files) directly inside directory, sorted.
+
+    Both lists come from a single os.scandir pass over the directory.
+    """
+    dirs = []
+    json_files = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                dirs.append(Path(entry.path))
+            elif entry.name.endswith(".json") and entry.is_file():
+                json_files.append(Path(entry.path))
+    dirs.sort()
+    json_files.sort()
+    return dirs, json_files
+
+
+@functools.lru_cache(maxsize=None)
+def load_json(path):
+    """Parse a JSON file (once per process).
+
+    Validation and compilation in the same process share the parsed data;
+    callers must treat the returned object as read-only.
+    """
+    return _json_loads(path.read_bytes())
+
+
+def build_validator(raw):
+    """Compile a JSON schema into a check(data) -> (ok, error) function.
+
+    Uses fastjsonschema for the full schema when it is installed; otherwise
+    the closure only checks the schema's required fields, with the
+    all-present case decided by a single set comparison.
+    """
+    if fastjsonschema is not None:
+        # use_default=False: validation must not fill schema defaults into
+        # data, which may be a parsed dict shared through load_json's cache
+        validate = fastjsonschema.compile(raw, use_default=False)
+
+        def check(data):
+            try:
+                validate(data)
+            except fastjsonschema.JsonSchemaException as e:
+                return False, e.message
+            return True, ""
+
+        return check
+
+    required = tuple(raw.get("required", ()))
+    required_set = frozenset(required)
+
+    def check(data):
+        if required_set <= data.keys():
+            return True, ""
+        missing = next(f for f in required if f not in data)
+        return False, f"Missing required field '{missing}'"
+
+    return check
+
+
+@dataclass(frozen=True)
+class Schema:
+    """A loaded JSON schema with its validator compiled once.
+
+    check is the function returned by build_validator.
+    """
+
+    name: str
+    raw: dict
+    required: tuple
+    check: object
 
+    def __reduce__(self):
+        # Compiled validators cannot be pickled; worker processes reload the
+        # schema by name (and compile it once per process) instead.
+        return load_schema, (self.name,)
 
+
+@functools.lru_cache(maxsize=None)
 def load_schema(schema_name):
-    """Load a JSON schema."""
-    schema_path = SCHEMA_DIR / schema_name
-    if schema_path.exists():
-        return json.loads(schema_path.read_text())
-    return None
+    """Load a JSON schema (read, parsed and compiled once per process)."""
+    try:
+        raw = load_json(SCHEMA_DIR / schema_name)
+    except FileNotFoundError:
+        return None
+    return Schema(
+        name=schema_name,
+        raw=raw,
+        required=tuple(raw.get("required", ())),
+        check=build_validator(raw),
+    )
 
 
 def validate_json(data, schema):
-    """Basic JSON validation against schema."""
+    """Validate JSON data against schema, printing the error if it fails."""
     if not schema:
         return True
 
-    # Check required fields
-    required = schema.get("required", [])
-    for field in required:
-        if field not in data:
-            print(f"Validation error: Missing required field '{field}'")
-            return False
+    ok, error = schema.check(data)
+    if not ok:
+        log.warning("Validation error: %s", error)
+    return ok
 
-    return True
+
+# Per-tool formatted strings, the only cache the tool formatters use. The
+# tool vocabulary is small and shared by all entities, so each spelling is
+# built once and then reused.
+_CAPITALIZED_TOOLS = {}
+_OPENCODE_TOOL_LINES = {}
+_QUOTED_LOWER_TOOLS = {}
 
 
 def format_tools_claude(tools):
@@ -76,8 +261,15 @@ def format_tools_claude(tools):
         return ""
     if isinstance(tools, list):
         # Convert to PascalCase
-        formatted = [t.capitalize() for t in tools]
-        return f"tools: [{', '.join(formatted)}]\n"
+        formatted = ", ".join(
+            [
+                _CAPITALIZED_TOOLS[t]
+                if t in _CAPITALIZED_TOOLS
+                else _CAPITALIZED_TOOLS.setdefault(t, t.capitalize())
+                for t in tools
+            ]
+        )
+        return f"tools: [{formatted}]\n"
     return ""
 
 
@@ -86,10 +278,14 @@ def format_tools_opencode(tools):
     if not tools or tools is False:
         return ""
     if isinstance(tools, list):
-        lines = ["tools:"]
-        for tool in tools:
-            lines.append(f"  {tool.lower()}: true")
-        return "\n".join(lines) + "\n"
+        return "tools:\n" + "".join(
+            [
+                _OPENCODE_TOOL_LINES[t]
+                if t in _OPENCODE_TOOL_LINES
+                else _OPENCODE_TOOL_LINES.setdefault(t, f"  {t.lower()}: true\n")
+                for t in tools
+            ]
+        )
     return ""
 
 
@@ -98,139 +294,290 @@ def format_tools_copilot(tools):
     if not tools or tools is False:
         return ""
     if isinstance(tools, list):
-        formatted = [f"'{t.lower()}'" for t in tools]
-        return f"tools: [{', '.join(formatted)}]\n"
+        formatted = ", ".join(
+            [
+                _QUOTED_LOWER_TOOLS[t]
+                if t in _QUOTED_LOWER_TOOLS
+                else _QUOTED_LOWER_TOOLS.setdefault(t, f"'{t.lower()}'")
+                for t in tools
+            ]
+        )
+        return f"tools: [{formatted}]\n"
     return ""
 
 
+# Block YAML indentation per nesting depth; deeper levels are built on demand
+_YAML_INDENTS = ["", "  ", "    ", "      ", "        "]
+
+
+def _yaml_indent(depth):
+    """Return the indentation string for a nesting depth."""
+    if depth < len(_YAML_INDENTS):
+        return _YAML_INDENTS[depth]
+    return "  " * depth
+
+
+class _YamlBuilder:
+    """Writes block-YAML lines into a single StringIO buffer."""
+
+    __slots__ = ("_buffer",)
+
+    def __init__(self):
+        self._buffer = io.StringIO()
+
+    def key(self, key, depth):
+        """Write `key:` opening a nested block."""
+        self._buffer.write(f"{_yaml_indent(depth)}{key}:\n")
+
+    def kv(self, key, value, depth):
+        """Write `key: value`."""
+        self._buffer.write(f"{_yaml_indent(depth)}{key}: {value}\n")
+
+    def seq_item(self, value, depth):
+        """Write a `- value` sequence item."""
+        self._buffer.write(f"{_yaml_indent(depth)}- {value}\n")
+
+    def seq_kv(self, key, value, depth):
+        """Write `- key: value`, the first line of a mapping sequence item."""
+        self._buffer.write(f"{_yaml_indent(depth)}- {key}: {value}\n")
+
+    def getvalue(self):
+        return self._buffer.getvalue()
+
+
 def format_permissions_opencode(permissions):
     """Format permissions for OpenCode."""
     if not permissions:
         return ""
-    lines = ["permissions:"]
+    yaml = _YamlBuilder()
+    yaml.key("permissions", 0)
     for key, value in permissions.items():
-        lines.append(f"  {key}: {value}")
-    return "\n".join(lines) + "\n"
+        yaml.kv(key, value, 1)
+    return yaml.getvalue()
 
 
 def format_handoffs_copilot(handoffs):
     """Format handoffs for Copilot."""
     if not handoffs:
         return ""
-    lines = ["handoffs:"]
+    yaml = _YamlBuilder()
+    yaml.key("handoffs", 0)
     for handoff in handoffs:
-        lines.append(f"  - label: {handoff.get('label', '')}")
-        lines.append(f"    agent: {handoff.get('agent', '')}")
+        yaml.seq_kv("label", handoff.get("label", ""), 1)
+        yaml.kv("agent", handoff.get("agent", ""), 2)
         if "prompt" in handoff:
-            lines.append(f"    prompt: {handoff['prompt']}")
+            yaml.kv("prompt", handoff["prompt"], 2)
         if "send" in handoff:
-            lines.append(f"    send: {handoff['send']}")
-    return "\n".join(lines) + "\n"
+            yaml.kv("send", handoff["send"], 2)
+    return yaml.getvalue()
 
 
 def format_mcp_servers_copilot(mcp_servers):
-    """Format MCP servers for Copilot."""
+    """Format MCP servers for Copilot.
+
+    Walks the (arbitrarily nested) config with an explicit stack instead of
+    recursion, emitting one block-YAML line per key or list item.
+    """
     if not mcp_servers:
         return ""
-    lines = ["mcpServers:"]
-    for name, config in mcp_servers.items():
-        lines.append(f"  {name}:")
-        for key, value in config.items():
-            if isinstance(value, dict):
-                lines.append(f"    {key}:")
-                for k, v in value.items():
-                    lines.append(f"      {k}: {v}")
-            elif isinstance(value, list):
-                lines.append(f"    {key}:")
-                for item in value:
-                    lines.append(f"      - {item}")
-            else:
-                lines.append(f"    {key}: {value}")
-    return "\n".join(lines) + "\n"
+    yaml = _YamlBuilder()
+    stack = [(0, "mcpServers", mcp_servers)]
+    while stack:
+        depth, key, value = stack.pop()
+        if isinstance(value, dict):
+            yaml.key(key, depth)
+            stack.extend((depth + 1, k, v) for k, v in reversed(value.items()))
+        elif isinstance(value, list):
+            yaml.key(key, depth)
+            for item in value:
+                yaml.seq_item(item, depth + 1)
+        else:
+            yaml.kv(key, value, depth)
+    return yaml.getvalue()
 
 
-def _format_scalar(key, value):
-    """Format scalar value without quotes for bools/numbers, quote strings when needed."""
-    if value is None:
-        return ""
+def _scalar_value(value):
+    """Format the value part of a scalar YAML line (see _format_scalar)."""
     if isinstance(value, bool):
-        return f"{key}: {str(value).lower()}\n"
+        return "true" if value else "false"
     if isinstance(value, (int, float)):
-        return f"{key}: {value}\n"
+        return str(value)
     s = str(value)
+    # "in" is a C-level scan; only the multiline branch splits the string
     if "\n" in s:
-        return f"{key}: |\n  " + "\n  ".join(s.splitlines()) + "\n"
-    # quote if contains colon or leading/trailing spaces
-    if ":" in s or s.strip() != s:
-        return f'{key}: "{s}"\n'
-    return f"{key}: {s}\n"
+        return "|\n  " + "\n  ".join(s.splitlines())
+    # quote if contains colon or leading/trailing spaces; checking the two
+    # end characters matches s.strip() != s without copying the string
+    if ":" in s or (s and (s[0].isspace() or s[-1].isspace())):
+        return f'"{s}"'
+    return s
 
 
-def compile_entity_for_provider(entity_data, provider, template_type="agents"):
-    """Generic entity (agent/skill/command) compiler for a provider.
+def _format_scalar(key, value):
+    """Format scalar value without quotes for bools/numbers, quote strings when needed."""
+    if value is None:
+        return ""
+    return f"{key}: {_scalar_value(value)}\n"
 
-    Produces a markdown string by populating provider-specific template with
-    a context built from entity_data. Re-uses existing formatters for tools,
-    permissions, handoffs and mcpServers.
-    """
-    # Check if enabled for this provider
-    providers = entity_data.get("providers", {})
-    if not providers.get(provider, True):
-        return None
 
-    template_name = f"{provider}.md.j2"
-    template = load_template(template_name, template_type=template_type)
+@dataclass
+class EntityConfig:
+    """The fields of an agent/skill/command JSON that the renderers read.
 
-    # Base context
-    context = {
-        "name": entity_data.get("name", ""),
-        "description": entity_data.get("description", ""),
-        "prompt": entity_data.get("prompt", ""),
-    }
+    Built once per entity (see from_dict) so each provider's renderer reads
+    attributes instead of repeating dict lookups. __slots__ is spelled out
+    because dataclass(slots=True) needs Python 3.10; the fields therefore
+    have no class-level defaults.
+    """
 
-    # Common properties and their section keys
-    # model, color, temperature, maxIterations, target
-    context["model_section"] = _format_scalar("model", entity_data.get("model"))
-    context["color_section"] = _format_scalar("color", entity_data.get("color"))
-    context["temperature_section"] = _format_scalar(
-        "temperature", entity_data.get("temperature")
+    __slots__ = (
+        "name",
+        "description",
+        "prompt",
+        "model",
+        "color",
+        "temperature",
+        "max_iterations",
+        "target",
+        "tools",
+        "permissions",
+        "handoffs",
+        "mcp_servers",
     )
+
+    name: str
+    description: str
+    prompt: str
+    model: Optional[str]
+    color: Optional[str]
+    temperature: Optional[float]
+    max_iterations: Optional[int]
+    target: Optional[str]
+    tools: Union[list, dict, bool, None]
+    permissions: Optional[dict]
+    handoffs: Optional[list]
+    mcp_servers: Optional[dict]
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a config from parsed entity JSON."""
+        return cls(
+            name=data.get("name", ""),
+            description=data.get("description", ""),
+            prompt=data.get("prompt", ""),
+            model=data.get("model"),
+            color=data.get("color"),
+            temperature=data.get("temperature"),
+            max_iterations=data.get("maxIterations"),
+            target=data.get("target"),
+            tools=data.get("tools"),
+            permissions=data.get("permissions"),
+            handoffs=data.get("handoffs"),
+            mcp_servers=data.get("mcpServers"),
+        )
+
+
+# Template placeholder -> builder(entity) for the provider-independent parts
+# of the context.
+_SECTION_BUILDERS = {
+    "name": lambda entity: entity.name,
+    "description": lambda entity: entity.description,
+    "prompt": lambda entity: entity.prompt,
+    # Common properties: model, color, temperature, maxIterations, target
+    "model_section": lambda entity: _format_scalar("model", entity.model),
+    "color_section": lambda entity: _format_scalar("color", entity.color),
+    "temperature_section": lambda entity: _format_scalar(
+        "temperature", entity.temperature
+    ),
     # Note: templates expect max_iterations_section
-    context["max_iterations_section"] = _format_scalar(
-        "maxIterations", entity_data.get("maxIterations")
-    )
-    context["target_section"] = _format_scalar("target", entity_data.get("target"))
-
-    # Tools (provider specific formatting)
-    if provider == "claude":
-        context["tools_section"] = format_tools_claude(entity_data.get("tools"))
-    elif provider == "opencode":
-        context["tools_section"] = format_tools_opencode(entity_data.get("tools"))
-    elif provider == "copilot":
-        context["tools_section"] = format_tools_copilot(entity_data.get("tools"))
-    else:
-        context["tools_section"] = ""
+    "max_iterations_section": lambda entity: _format_scalar(
+        "maxIterations", entity.max_iterations
+    ),
+    "target_section": lambda entity: _format_scalar("target", entity.target),
+}
+
+# Provider name -> (context key, EntityConfig attribute, formatter) for each
+# provider-specific section. Every formatter returns "" for a falsy value, so
+# empty sections skip the call entirely.
+_PROVIDER_SECTIONS = {
+    "claude": (("tools_section", "tools", format_tools_claude),),
+    "opencode": (
+        ("tools_section", "tools", format_tools_opencode),
+        ("permissions_section", "permissions", format_permissions_opencode),
+    ),
+    "copilot": (
+        ("tools_section", "tools", format_tools_copilot),
+        ("handoffs_section", "handoffs", format_handoffs_copilot),
+        ("mcp_servers_section", "mcp_servers", format_mcp_servers_copilot),
+    ),
+}
+
+
+def _empty_section(entity):
+    return ""
 
-    # Permissions (opencode)
-    context["permissions_section"] = (
-        format_permissions_opencode(entity_data.get("permissions"))
-        if provider == "opencode"
-        else ""
-    )
 
-    # Handoffs and mcpServers (copilot)
-    context["handoffs_section"] = (
-        format_handoffs_copilot(entity_data.get("handoffs"))
-        if provider == "copilot"
-        else ""
+def _section_builder(attr, formatter):
+    """Return a builder that formats entity.<attr>, or "" when it is empty."""
+
+    def build(entity):
+        value = getattr(entity, attr)
+        return formatter(value) if value else ""
+
+    return build
+
+
+@functools.lru_cache(maxsize=None)
+def _load_renderer(provider, template_type):
+    """Return (template, ((key, builder), ...)) for a provider's template.
+
+    Only the placeholders the template actually uses get a builder, so
+    sections a template never references are never formatted. Provider
+    sections that another provider defines render as "" here; unknown
+    placeholders are left out and raise KeyError on render.
+    """
+    template = load_template(f"{provider}.md.j2", template_type=template_type)
+    builders = dict.fromkeys(
+        (key for sections in _PROVIDER_SECTIONS.values() for key, _, _ in sections),
+        _empty_section,
     )
-    context["mcp_servers_section"] = (
-        format_mcp_servers_copilot(entity_data.get("mcpServers"))
-        if provider == "copilot"
-        else ""
+    builders.update(_SECTION_BUILDERS)
+    for key, attr, formatter in _PROVIDER_SECTIONS[provider]:
+        builders[key] = _section_builder(attr, formatter)
+    return template, tuple(
+        (key, builders[key]) for key in sorted(template.keys) if key in builders
     )
 
-    return template.substitute(context)
+
+def compile_entity_for_provider(entity_data, provider, template_type="agents"):
+    """Generic entity (agent/skill/command) compiler for a provider.
+
+    Produces a markdown string by populating provider-specific template with
+    a context built from entity_data (a parsed JSON dict or an EntityConfig).
+    Re-uses existing formatters for tools, permissions, handoffs and
+    mcpServers, but only for the sections the template references. Returns
+    None for providers that have no renderer (e.g. gemini); callers filter
+    out providers the entity disables with enabled_providers().
+    """
+    if provider not in _PROVIDER_SECTIONS:
+        return None
+
+    if not isinstance(entity_data, EntityConfig):
+        entity_data = EntityConfig.from_dict(entity_data)
+    template, builders = _load_renderer(provider, template_type)
+    return template({key: build(entity_data) for key, build in builders})
+
+
+def enabled_providers(entity_data, providers):
+    """Return the providers to render for an entity, in the given order.
+
+    Drops providers the entity disables in its "providers" map as well as
+    providers without a renderer.
+    """
+    provider_map = entity_data.get("providers") or {}
+    return [
+        p for p in providers if p in _PROVIDER_SECTIONS and provider_map.get(p, True)
+    ]
 
 
 def compile_agent_for_provider(agent_data, provider):
@@ -245,347 +592,857 @@ def compile_command_for_provider(command_data, provider):
     return compile_entity_for_provider(command_data, provider, template_type="agents")
 
 
-def write_agent_output(agent_name, content, provider):
-    """Write compiled agent to output directory."""
-    provider_dir = PROVIDER_PATHS[provider]
-    agents_dir = provider_dir / "agents"
-    agents_dir.mkdir(parents=True, exist_ok=True)
+# Default number of I/O threads (--jobs) used to overlap output file writes
+# and skill artifact copies in compile_all_*
+_DEFAULT_JOBS = min(32, (os.cpu_count() or 1) * 4)
 
-    # File extension
-    output_file = agents_dir / f"{agent_name}.md"
-    output_file.write_text(content)
-    print(f"  Written: {output_file}")
+# Output directories already created in this process
+_CREATED_DIRS = set()
 
-    # Create manifest entry
-    manifest_file = agents_dir / "manifest.txt"
-    if not manifest_file.exists():
-        manifest_file.write_text(f"{agent_name}\n")
-    else:
-        current_content = manifest_file.read_text().strip()
-        if agent_name not in current_content:
-            manifest_file.write_text(f"{current_content}\n{agent_name}\n")
 
+def ensure_dir(path):
+    """Create path (and parents) once per process; later calls are a set lookup."""
+    if path not in _CREATED_DIRS:
+        os.makedirs(path, exist_ok=True)
+        _CREATED_DIRS.add(path)
+
+
+def _write_bytes(path, data):
+    """Write data to a temporary file with a raw fd and rename it over path.
+
+    Skips the buffered file object that Path.write_bytes sets up for what is
+    a single small write. Replacing path rather than truncating it matters
+    because skill artifacts are hardlinked to their sources (_link_or_copy):
+    an in-place write would go straight through to the file in skills/.
+    """
+    tmp = f"{path}.{os.getpid()}.tmp"
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(tmp, flags, 0o666)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp)
+        raise
+
+
+def write_if_changed(path, content):
+    """Write content to path unless the file already holds exactly that text.
+
+    Leaving unchanged outputs untouched keeps their mtimes stable for
+    downstream tools. Returns True if the file was written.
+    """
+    data = content.encode("utf-8")
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    _write_bytes(path, data)
+    return True
 
-def write_command_output(command_name, content, provider):
-    """Write compiled command to output directory (treat like agents)."""
-    provider_dir = PROVIDER_PATHS[provider]
-    commands_dir = provider_dir / "commands"
-    commands_dir.mkdir(parents=True, exist_ok=True)
 
-    output_file = commands_dir / f"{command_name}.md"
-    output_file.write_text(content)
-    print(f"  Written: {output_file}")
+def _report_writes(files, writer=None):
+    """Write (output_file, content) pairs and log, in order, whether each changed.
 
-    # Create/update manifest in commands/ directory
-    manifest_file = commands_dir / "manifest.txt"
-    if not manifest_file.exists():
-        manifest_file.write_text(f"{command_name}\n")
+    With a thread pool as writer the files are written concurrently; the
+    write() syscalls release the GIL, so the kernel can overlap them.
+    """
+    paths = [path for path, _ in files]
+    contents = [content for _, content in files]
+    if writer is None:
+        changed = map(write_if_changed, paths, contents)
     else:
-        current_content = manifest_file.read_text().strip()
-        if command_name not in current_content:
-            manifest_file.write_text(f"{current_content}\n{command_name}\n")
+        changed = writer.map(write_if_changed, paths, contents)
+    for output_file, was_written in zip(paths, changed):
+        if was_written:
+            log.debug("  Written: %s", output_file)
+        else:
+            log.debug("  Unchanged: %s", output_file)
+
+
+# manifest.txt path -> entries recorded since the last flush_manifests()
+_PENDING_MANIFESTS = {}
+
+
+def _add_manifest_entry(manifest_file, name):
+    """Record name for manifest_file; written out by flush_manifests()."""
+    _PENDING_MANIFESTS.setdefault(manifest_file, set()).add(name)
 
 
-def write_skill_output(skill_name, content, provider):
-    """Write compiled skill to output directory."""
-    provider_dir = PROVIDER_PATHS[provider]
+def flush_manifests():
+    """Merge the recorded entries into their manifest.txt files.
+
+    Each manifest is read and written once per batch instead of once per
+    entity. Existing entries are kept (matched as whole lines) and the result
+    is sorted.
+    """
+    for manifest_file, entries in _PENDING_MANIFESTS.items():
+        try:
+            with open(manifest_file) as f:
+                entries.update(line for line in f.read().splitlines() if line)
+        except FileNotFoundError:
+            pass
+        write_if_changed(manifest_file, "\n".join(sorted(entries)) + "\n")
+    _PENDING_MANIFESTS.clear()
+
+
+def _agent_output_file(agent_name, provider):
+    """Return output/<provider>/agents/<agent_name>.md, creating its directory."""
+    agents_dir = _PROV_AGENT_DIR[provider]
+    ensure_dir(agents_dir)
+    return f"{agents_dir}/{agent_name}.md"
+
+
+def _command_output_file(command_name, provider):
+    """Return output/<provider>/commands/<command_name>.md, creating its directory."""
+    commands_dir = _PROV_COMMAND_DIR[provider]
+    ensure_dir(commands_dir)
+    return f"{commands_dir}/{command_name}.md"
+
+
+def write_skill_output(skill_name, content, provider, writer=None):
+    """Write compiled skill to output directory.
+
+    writer is an optional thread pool used to copy the skill's artifacts.
+    """
     # Place SKILL.md in output/.provider/skills/<skill-name>/SKILL.md
-    skills_root = provider_dir / "skills"
-    skill_dir = skills_root / skill_name
-    skill_dir.mkdir(parents=True, exist_ok=True)
+    skills_root = _PROV_SKILLS_DIR[provider]
+    skill_dir = f"{skills_root}/{skill_name}"
+    ensure_dir(skill_dir)
 
-    output_file = skill_dir / "SKILL.md"
-    output_file.write_text(content)
-    print(f"  Written: {output_file}")
+    output_file = f"{skill_dir}/SKILL.md"
+    _report_writes([(output_file, content)])
 
     # Copy other files and folders from skill source directory (e.g., examples.md, reference.md, scripts/)
-    add_skill_files(skill_name, provider)
+    add_skill_files(skill_name, provider, writer)
 
     # Build manifest entries for this provider's skills directory. We include a top-level
     # entry for the skill name (so consumers can fetch SKILL.md by just the skill name)
     # and explicit entries for every file under the skill directory so the fetcher can
     # download auxiliary files.
-    manifest_file = skills_root / "manifest.txt"
-    all_entries = set()
+    manifest_file = f"{skills_root}/manifest.txt"
 
     # Add the bare skill name (interpreted by fetcher as skill/SKILL.md)
-    all_entries.add(f"{skill_name}")
-
-    # Walk files under the skill_dir and add relative paths like "skill-name/examples.md"
-    for p in skill_dir.rglob("*"):
-        if p.is_file():
-            rel = p.relative_to(skills_root)
-            # Normalize to posix style
-            all_entries.add(str(rel).replace("\\", "/"))
+    _add_manifest_entry(manifest_file, skill_name)
 
-    # Write manifest (overwrite to keep deterministic ordering)
-    sorted_entries = sorted(list(all_entries))
-    manifest_file.write_text("\n".join(sorted_entries) + "\n")
-
-    # Also write a per-skill manifest inside the skill directory listing files relative to the skill root
-    per_skill_manifest = skill_dir / "manifest.txt"
+    # Walk files under the skill_dir once; the per-skill manifest lists them
+    # relative to the skill root ("examples.md") and the skills manifest
+    # relative to skills/ ("skill-name/examples.md")
+    per_skill_manifest = f"{skill_dir}/manifest.txt"
     per_skill_lines = []
-    for p in skill_dir.rglob("*"):
-        if p.is_file():
-            rel_to_skill = p.relative_to(skill_dir)
-            per_skill_lines.append(str(rel_to_skill).replace("\\", "/"))
+    for dirpath, _, filenames in os.walk(skill_dir):
+        # Normalize to posix style
+        prefix = dirpath[len(skill_dir) + 1 :].replace("\\", "/")
+        for filename in filenames:
+            rel_to_skill = f"{prefix}/{filename}" if prefix else filename
+            per_skill_lines.append(rel_to_skill)
+            _add_manifest_entry(manifest_file, f"{skill_name}/{rel_to_skill}")
     per_skill_lines.sort()
-    per_skill_manifest.write_text("\n".join(per_skill_lines) + "\n")
+    write_if_changed(per_skill_manifest, "\n".join(per_skill_lines) + "\n")
+
+
+def _link_or_copy(src, dst):
+    """Hardlink src to dst, falling back to shutil.copy where links fail.
+
+    Skill artifacts are identical for every provider, so linking avoids
+    writing the same bytes once per provider. Cross-device targets and
+    filesystems without hardlink support get a regular copy. Any existing dst
+    is removed first so a stale copy (or link) is always replaced; outputs
+    are only ever rewritten by replacing them (see _write_bytes), so the
+    linked sources are never modified.
+    """
+    try:
+        os.unlink(dst)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy(src, dst)
+    return dst
+
 
+def _copy_skill_entry(src, dest, is_dir):
+    """Place one skill artifact (file or directory).
 
-def add_skill_files(skill_name, provider):
+    Returns the (level, msg, *args) of its log record, which the caller logs.
+    """
+    try:
+        if is_dir:
+            # If destination exists, remove and replace to keep output deterministic
+            with contextlib.suppress(FileNotFoundError):
+                shutil.rmtree(dest)
+            shutil.copytree(src, dest, copy_function=_link_or_copy)
+            return logging.DEBUG, "  Copied directory: %s -> %s", src, dest
+        _link_or_copy(src, dest)
+        return logging.DEBUG, "  Copied file: %s -> %s", src, dest
+    except Exception as e:
+        return logging.WARNING, "  Warning: Failed to copy %s -> %s: %s", src, dest, e
+
+
+def add_skill_files(skill_name, provider, writer=None):
     """Copy non-compiled files from skills/<skill_name> to output/<provider>/skills/<skill_name>.
 
     Skill directories contain a .json (which is compiled into SKILL.md) and
     other artifacts (examples.md, reference.md, scripts/, ...) which should be
-    copied verbatim for the provider output. JSON files are skipped.
+    copied verbatim for the provider output. JSON files are skipped. With a
+    thread pool as writer the entries are copied concurrently; the log lines
+    are still printed in directory order.
     """
-    if provider not in PROVIDER_PATHS:
-        print(f"  Warning: Unknown provider '{provider}', skipping copying skill files")
+    if provider not in _PROV_SKILLS_DIR:
+        log.warning(
+            "  Warning: Unknown provider '%s', skipping copying skill files", provider
+        )
         return
 
     src_dir = SKILLS_DIR / skill_name
-    if not src_dir.exists():
-        print(f"  Warning: Skill source directory not found: {src_dir}")
+    try:
+        entries = os.scandir(src_dir)
+    except FileNotFoundError:
+        log.warning("  Warning: Skill source directory not found: %s", src_dir)
         return
 
-    dest_dir = PROVIDER_PATHS[provider] / "skills" / skill_name
-    dest_dir.mkdir(parents=True, exist_ok=True)
+    dest_dir = f"{_PROV_SKILLS_DIR[provider]}/{skill_name}"
+    ensure_dir(dest_dir)
+
+    # Entries come from one scandir pass; is_dir() reuses the dirent type.
+    # Files are hardlinked to the source where possible (see _link_or_copy);
+    # the shutil.copy fallback keeps the permission bits, so scripts stay
+    # executable either way.
+    srcs, dests, is_dirs = [], [], []
+    with entries:
+        for entry in entries:
+            is_dir = entry.is_dir()
+            # Skip the JSON source file (it's compiled, not copied)
+            if not is_dir and entry.name.lower().endswith(".json"):
+                continue
+            srcs.append(entry.path)
+            dests.append(f"{dest_dir}/{entry.name}")
+            is_dirs.append(is_dir)
+
+    if writer is None:
+        messages = map(_copy_skill_entry, srcs, dests, is_dirs)
+    else:
+        messages = writer.map(_copy_skill_entry, srcs, dests, is_dirs)
+    for level, msg, *args in messages:
+        log.log(level, msg, *args)
+
 
-    for item in src_dir.iterdir():
-        # Skip the JSON source file (it's compiled, not copied)
-        if item.is_file() and item.suffix.lower() == ".json":
-            continue
+def render_agent(agent_file, providers=None, schema=None, agent_data=None):
+    """Load, validate and render a single agent file without writing it.
 
-        dest_path = dest_dir / item.name
-        try:
-            if item.is_dir():
-                # If destination exists, remove and replace to keep output deterministic
-                if dest_path.exists():
-                    shutil.rmtree(dest_path)
-                shutil.copytree(item, dest_path)
-                print(f"  Copied directory: {item} -> {dest_path}")
-            else:
-                shutil.copy2(item, dest_path)
-                print(f"  Copied file: {item} -> {dest_path}")
-        except Exception as e:
-            print(f"  Warning: Failed to copy {item} -> {dest_path}: {e}")
-
-
-def compile_agent(agent_file, providers=None):
-    """Compile a single agent file."""
-    print(f"\nCompiling agent: {agent_file.name}")
+    schema and agent_data may be passed in by callers that already loaded
+    them, so a batch loads the schema once and no file is parsed twice.
+    Returns (agent_name, [(provider, content), ...]) or None on failure.
+    """
+    log.debug("\nCompiling agent: %s", agent_file.name)
 
     # Load and validate
-    agent_data = json.loads(agent_file.read_text())
-    schema = load_schema("agent.schema.json")
+    if agent_data is None:
+        agent_data = load_json(agent_file)
+    if schema is None:
+        schema = load_schema("agent.schema.json")
 
     if not validate_json(agent_data, schema):
-        print(f"  Error: Validation failed for {agent_file.name}")
-        return False
+        log.error("  Error: Validation failed for %s", agent_file.name)
+        return None
 
     agent_name = agent_data.get("name")
     if not agent_name:
-        print(f"  Error: Agent name not found in {agent_file.name}")
-        return False
+        log.error("  Error: Agent name not found in %s", agent_file.name)
+        return None
 
-    # Compile for each provider
-    providers_to_compile = providers or ["claude", "opencode", "copilot"]
-    compiled_count = 0
+    # Compile for each provider the agent does not disable
+    providers_to_compile = enabled_providers(
+        agent_data, providers or _DEFAULT_AGENT_PROVIDERS
+    )
+    if not providers_to_compile:
+        log.warning("  Warning: No enabled providers for %s", agent_file.name)
+        return agent_name, []
+    agent_config = EntityConfig.from_dict(agent_data)
+    rendered = []
 
     for provider in providers_to_compile:
-        content = compile_agent_for_provider(agent_data, provider)
+        content = compile_agent_for_provider(agent_config, provider)
         if content:
-            write_agent_output(agent_name, content, provider)
-            compiled_count += 1
+            rendered.append((provider, content))
+
+    return agent_name, rendered
 
-    print(f"  Compiled to {compiled_count} provider(s)")
+
+def write_agent(result, writer=None):
+    """Write the outputs returned by render_agent.
+
+    writer is an optional thread pool used to write the provider files
+    concurrently.
+    """
+    if result is None:
+        return False
+    agent_name, rendered = result
+    files = [
+        (_agent_output_file(agent_name, provider), content)
+        for provider, content in rendered
+    ]
+    _report_writes(files, writer)
+    for provider, _ in rendered:
+        _add_manifest_entry(f"{_PROV_AGENT_DIR[provider]}/manifest.txt", agent_name)
+
+    log.debug("  Compiled to %d provider(s)", len(rendered))
     return True
 
 
-def compile_command(command_file, providers=None):
-    """Compile a single command file."""
-    print(f"\nCompiling command: {command_file.name}")
+def compile_agent(agent_file, providers=None, schema=None, agent_data=None):
+    """Compile a single agent file."""
+    result = write_agent(render_agent(agent_file, providers, schema, agent_data))
+    flush_manifests()
+    return result
+
+
+def render_command(command_file, providers=None, schema=None, command_data=None):
+    """Load, validate and render a single command file without writing it.
+
+    schema and command_data may be passed in by callers that already loaded
+    them, so a batch loads the schema once and no file is parsed twice.
+    Returns (command_name, [(provider, content), ...]) or None on failure.
+    """
+    log.debug("\nCompiling command: %s", command_file.name)
 
     # Load and validate
-    command_data = json.loads(command_file.read_text())
-    schema = load_schema("command.schema.json")
+    if command_data is None:
+        command_data = load_json(command_file)
+    if schema is None:
+        schema = load_schema("command.schema.json")
 
     if not validate_json(command_data, schema):
-        print(f"  Error: Validation failed for {command_file.name}")
-        return False
+        log.error("  Error: Validation failed for %s", command_file.name)
+        return None
 
     command_name = command_data.get("name")
     if not command_name:
-        print(f"  Error: Command name not found in {command_file.name}")
-        return False
+        log.error("  Error: Command name not found in %s", command_file.name)
+        return None
 
-    # Compile for each provider
-    providers_to_compile = providers or ["claude", "opencode", "copilot"]
-    compiled_count = 0
+    # Compile for each provider the command does not disable
+    providers_to_compile = enabled_providers(
+        command_data, providers or _DEFAULT_AGENT_PROVIDERS
+    )
+    if not providers_to_compile:
+        log.warning("  Warning: No enabled providers for %s", command_file.name)
+        return command_name, []
+    command_config = EntityConfig.from_dict(command_data)
+    rendered = []
 
     for provider in providers_to_compile:
-        content = compile_command_for_provider(command_data, provider)
+        content = compile_command_for_provider(command_config, provider)
         if content:
-            write_command_output(command_name, content, provider)
-            compiled_count += 1
+            rendered.append((provider, content))
 
-    print(f"  Compiled to {compiled_count} provider(s)")
+    return command_name, rendered
+
+
+def write_command(result, writer=None):
+    """Write the outputs returned by render_command.
+
+    writer is an optional thread pool used to write the provider files
+    concurrently.
+    """
+    if result is None:
+        return False
+    command_name, rendered = result
+    files = [
+        (_command_output_file(command_name, provider), content)
+        for provider, content in rendered
+    ]
+    _report_writes(files, writer)
+    for provider, _ in rendered:
+        _add_manifest_entry(
+            f"{_PROV_COMMAND_DIR[provider]}/manifest.txt", command_name
+        )
+
+    log.debug("  Compiled to %d provider(s)", len(rendered))
     return True
 
 
-def compile_skill(skill_file, providers=None):
-    """Compile a single skill file."""
-    print(f"\nCompiling skill: {skill_file.name}")
+def compile_command(command_file, providers=None, schema=None, command_data=None):
+    """Compile a single command file."""
+    result = write_command(
+        render_command(command_file, providers, schema, command_data)
+    )
+    flush_manifests()
+    return result
+
+
+def render_skill(skill_file, providers=None, schema=None, skill_data=None):
+    """Load, validate and render a single skill file without writing it.
+
+    schema and skill_data may be passed in by callers that already loaded
+    them, so a batch loads the schema once and no file is parsed twice.
+    Returns (skill_name, [(provider, content), ...]) or None on failure.
+    """
+    log.debug("\nCompiling skill: %s", skill_file.name)
 
     # Load and validate
-    skill_data = json.loads(skill_file.read_text())
-    schema = load_schema("skill.schema.json")
+    if skill_data is None:
+        skill_data = load_json(skill_file)
+    if schema is None:
+        schema = load_schema("skill.schema.json")
 
     if not validate_json(skill_data, schema):
-        print(f"  Error: Validation failed for {skill_file.name}")
-        return False
+        log.error("  Error: Validation failed for %s", skill_file.name)
+        return None
 
     skill_name = skill_data.get("name")
     if not skill_name:
-        print(f"  Error: Skill name not found in {skill_file.name}")
-        return False
+        log.error("  Error: Skill name not found in %s", skill_file.name)
+        return None
 
-    # Compile for each provider
-    providers_to_compile = providers or ["claude", "opencode"]
-    compiled_count = 0
+    # Compile for each provider the skill does not disable
+    providers_to_compile = enabled_providers(
+        skill_data, providers or _DEFAULT_SKILL_PROVIDERS
+    )
+    if not providers_to_compile:
+        log.warning("  Warning: No enabled providers for %s", skill_file.name)
+        return skill_name, []
+    skill_config = EntityConfig.from_dict(skill_data)
+    rendered = []
 
     for provider in providers_to_compile:
-        content = compile_skill_for_provider(skill_data, provider)
+        content = compile_skill_for_provider(skill_config, provider)
         if content:
-            write_skill_output(skill_name, content, provider)
-            add_skill_files(skill_name, provider)  # Copy additional skill files
-            compiled_count += 1
+            rendered.append((provider, content))
+
+    return skill_name, rendered
+
+
+def write_skill(result, writer=None):
+    """Write the outputs returned by render_skill.
+
+    writer is an optional thread pool used to copy the skill artifacts
+    concurrently.
+    """
+    if result is None:
+        return False
+    skill_name, rendered = result
+    for provider, content in rendered:
+        # Also copies the additional skill files (before building the manifests)
+        write_skill_output(skill_name, content, provider, writer)
 
-    print(f"  Compiled to {compiled_count} provider(s)")
+    log.debug("  Compiled to %d provider(s)", len(rendered))
     return True
 
 
-def compile_all_agents(providers=None):
-    """Compile all agents in the agents directory."""
-    if not AGENTS_DIR.exists():
-        print(f"Agents directory not found: {AGENTS_DIR}")
+def compile_skill(skill_file, providers=None, schema=None, skill_data=None):
+    """Compile a single skill file."""
+    result = write_skill(render_skill(skill_file, providers, schema, skill_data))
+    flush_manifests()
+    return result
+
+
+class _BufferedStreamHandler(logging.StreamHandler):
+    """StreamHandler that leaves flushing to the stream's own buffering.
+
+    logging.StreamHandler flushes after every record, which would turn each
+    progress line into its own write(2) on the block-buffered stdout.
+    """
+
+    def flush(self):
+        pass
+
+
+def configure_logging(verbose=False, stream=None):
+    """Send log records, message text only, to stream (default: stdout).
+
+    Per-file progress (written, unchanged and copied files) is logged at
+    DEBUG and only shown when verbose.
+    """
+    handler = _BufferedStreamHandler(sys.stdout if stream is None else stream)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    log.handlers = [handler]
+    log.setLevel(logging.DEBUG if verbose else logging.INFO)
+    log.propagate = False
+
+
+def _render_captured(render, entity_file, providers, schema, level):
+    """Run render() in a worker process, returning (log text, result).
+
+    The worker's records are captured at the parent's level and replayed in
+    order by render_all.
+    """
+    buffer = io.StringIO()
+    saved = log.handlers, log.level, log.propagate
+    configure_logging(stream=buffer)
+    log.setLevel(level)
+    try:
+        result = render(entity_file, providers, schema)
+    finally:
+        log.handlers, log.level, log.propagate = saved
+    return buffer.getvalue(), result
+
+
+# Smallest batch rendered in a process pool. One render takes well under a
+# millisecond, so for smaller batches the pool start-up and the per-task
+# pickling cost more than the rendering they spread out.
+_MIN_PARALLEL_BATCH = 200
+
+
+def _usable_cpus():
+    """Return the number of CPUs this process may run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on macOS/Windows
+        return os.cpu_count() or 1
+
+
+def render_all(render, entity_files, providers=None, schema=None, executor=None):
+    """Yield render(entity_file, providers, schema) for each file, in order.
+
+    Entities are independent, so a batch of at least _MIN_PARALLEL_BATCH files
+    on a machine with more than one usable CPU is rendered in a process pool:
+    executor if given (so several batches can share one set of workers),
+    otherwise a pool created for this batch. Smaller batches render in this
+    process. Output is written back by the caller in the main process, which
+    keeps file writes, manifests and log output in a deterministic order.
+    """
+    cpus = _usable_cpus()
+    if len(entity_files) < _MIN_PARALLEL_BATCH or cpus < 2:
+        for entity_file in entity_files:
+            yield render(entity_file, providers, schema)
+        return
+
+    if executor is None:
+        with ProcessPoolExecutor() as executor:
+            yield from render_all(render, entity_files, providers, schema, executor)
+        return
+
+    for output, result in executor.map(
+        _render_captured,
+        repeat(render),
+        entity_files,
+        repeat(providers),
+        repeat(schema),
+        repeat(log.getEffectiveLevel()),
+        # A few chunks per worker keeps the IPC round trips per batch low
+        chunksize=max(1, len(entity_files) // (cpus * 4)),
+    ):
+        sys.stdout.write(output)
+        yield result
+
+
+def load_build_cache():
+    """Return the build cache written by the last run, or {} if unusable."""
+    try:
+        cache = _json_loads(BUILD_CACHE_FILE.read_bytes())
+    except (FileNotFoundError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_build_cache(cache):
+    """Write the build cache (see BUILD_CACHE_FILE)."""
+    write_if_changed(BUILD_CACHE_FILE, json.dumps(cache, indent=1, sort_keys=True))
+
+
+def _stat_stamp(path):
+    """Return [mtime_ns, size] for path, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _batch_stamp(template_type, schema_name, providers):
+    """Return the stamps of the inputs shared by every entity in a batch.
+
+    Covers the requested providers, this compiler, the schema and every
+    template of template_type, so editing any of them rebuilds the batch.
+    """
+    with os.scandir(TEMPLATES_DIR / template_type) as entries:
+        templates = sorted(
+            [entry.name, _stat_stamp(entry.path)]
+            for entry in entries
+            if entry.is_file()
+        )
+    return {
+        "providers": providers,
+        "compiler": _stat_stamp(__file__),
+        "schema": _stat_stamp(SCHEMA_DIR / schema_name),
+        "templates": templates,
+    }
+
+
+def _entity_stamp(entity_file, batch_stamp, artifact_dir=None):
+    """Return the input stamps of one entity: its source plus the batch inputs.
+
+    artifact_dir adds every file below it, for skills whose artifacts are
+    copied into the output.
+    """
+    stamp = {"source": _stat_stamp(entity_file), "batch": batch_stamp}
+    if artifact_dir is not None:
+        artifacts = []
+        for dirpath, _, filenames in os.walk(artifact_dir):
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                rel = os.path.relpath(path, artifact_dir)
+                artifacts.append([rel, _stat_stamp(path)])
+        stamp["artifacts"] = sorted(artifacts)
+    return stamp
+
+
+def _cache_key(entity_file):
+    return Path(entity_file).relative_to(BASE_DIR).as_posix()
+
+
+def _plan_build(entity_files, stamps, cache, force=False):
+    """Return the entity files that need compiling.
+
+    An entity is up to date when its recorded input stamps match and all of
+    its recorded outputs still exist. Without a cache (or with force) every
+    file is compiled.
+    """
+    if cache is None or force:
+        return list(entity_files)
+    stale = []
+    for entity_file in entity_files:
+        entry = cache.get(_cache_key(entity_file))
+        if (
+            entry is None
+            or entry.get("stamp") != stamps[entity_file]
+            or not all(os.path.exists(path) for path in entry.get("outputs", ()))
+        ):
+            stale.append(entity_file)
+    return stale
+
+
+def _record_build(cache, entity_file, stamp, outputs):
+    """Remember the inputs and outputs of a successfully compiled entity."""
+    if cache is not None:
+        cache[_cache_key(entity_file)] = {"stamp": stamp, "outputs": outputs}
+
+
+def _summary_suffix(up_to_date):
+    return f" ({up_to_date} up to date)" if up_to_date else ""
+
+
+def compile_all_agents(
+    providers=None, executor=None, jobs=_DEFAULT_JOBS, cache=None, force=False
+):
+    """Compile all agents in the agents directory.
+
+    executor is an optional process pool shared with other batches; jobs is
+    the number of threads used to write the output files. With a build cache
+    (see load_build_cache) unchanged agents are skipped unless force is set.
+    """
+    try:
+        agent_files = list_json_files(AGENTS_DIR)
+    except FileNotFoundError:
+        log.warning("Agents directory not found: %s", AGENTS_DIR)
         return
 
-    agent_files = list(AGENTS_DIR.glob("*.json"))
-    print("\n=== Compiling All Agents ===")
+    log.info("\n=== Compiling All Agents ===")
     success_count = 0
     total = len(agent_files)
-    for agent_file in agent_files:
-        if compile_agent(agent_file, providers):
-            success_count += 1
+    schema = load_schema("agent.schema.json")
+    batch_stamp = _batch_stamp("agents", "agent.schema.json", providers)
+    stamps = {f: _entity_stamp(f, batch_stamp) for f in agent_files}
+    stale = _plan_build(agent_files, stamps, cache, force)
+    # The writer threads start on first use, after render_all has forked its
+    # worker processes.
+    with ThreadPoolExecutor(max_workers=jobs) as writer:
+        results = render_all(render_agent, stale, providers, schema, executor)
+        for agent_file, result in zip(stale, results):
+            if write_agent(result, writer):
+                success_count += 1
+                name, rendered = result
+                outputs = [_agent_output_file(name, p) for p, _ in rendered]
+                _record_build(cache, agent_file, stamps[agent_file], outputs)
+
+    flush_manifests()
+    up_to_date = total - len(stale)
+    log.info(
+        "\n✓ Compiled %d/%d agents%s",
+        success_count,
+        len(stale),
+        _summary_suffix(up_to_date),
+    )
 
-    print(f"\n✓ Compiled {success_count}/{total} agents")
 
+def compile_all_commands(
+    providers=None, executor=None, jobs=_DEFAULT_JOBS, cache=None, force=False
+):
+    """Compile all commands in the commands directory.
 
-def compile_all_commands(providers=None):
-    """Compile all commands in the commands directory."""
-    if not COMMANDS_DIR.exists():
-        print(f"Commands directory not found: {COMMANDS_DIR}")
+    executor is an optional process pool shared with other batches; jobs is
+    the number of threads used to write the output files. With a build cache
+    (see load_build_cache) unchanged commands are skipped unless force is set.
+    """
+    try:
+        command_files = list_json_files(COMMANDS_DIR)
+    except FileNotFoundError:
+        log.warning("Commands directory not found: %s", COMMANDS_DIR)
         return
 
-    command_files = list(COMMANDS_DIR.glob("*.json"))
-    print("\n=== Compiling All Commands ===")
+    log.info("\n=== Compiling All Commands ===")
     success_count = 0
     total = len(command_files)
-    for command_file in command_files:
-        if compile_command(command_file, providers):
-            success_count += 1
-
-    print(f"\n✓ Compiled {success_count}/{total} commands")
+    schema = load_schema("command.schema.json")
+    batch_stamp = _batch_stamp("agents", "command.schema.json", providers)
+    stamps = {f: _entity_stamp(f, batch_stamp) for f in command_files}
+    stale = _plan_build(command_files, stamps, cache, force)
+    # The writer threads start on first use, after render_all has forked its
+    # worker processes.
+    with ThreadPoolExecutor(max_workers=jobs) as writer:
+        results = render_all(render_command, stale, providers, schema, executor)
+        for command_file, result in zip(stale, results):
+            if write_command(result, writer):
+                success_count += 1
+                name, rendered = result
+                outputs = [_command_output_file(name, p) for p, _ in rendered]
+                _record_build(cache, command_file, stamps[command_file], outputs)
+
+    flush_manifests()
+    up_to_date = total - len(stale)
+    log.info(
+        "\n✓ Compiled %d/%d commands%s",
+        success_count,
+        len(stale),
+        _summary_suffix(up_to_date),
+    )
 
 
-def compile_all_skills(providers=None):
-    """Compile all skills in the skills directory."""
-    if not SKILLS_DIR.exists():
-        print(f"Skills directory not found: {SKILLS_DIR}")
-        return
+def compile_all_skills(
+    providers=None, executor=None, jobs=_DEFAULT_JOBS, cache=None, force=False
+):
+    """Compile all skills in the skills directory.
 
-    print("\n=== Compiling All Skills ===")
+    executor is an optional process pool shared with other batches; jobs is
+    the number of threads used to copy the skill artifacts. With a build cache
+    (see load_build_cache) unchanged skills are skipped unless force is set.
+    """
     # New layout: each skill is a subdirectory under skills/<skill-name>/
     # Expect the JSON descriptor inside the subdirectory (e.g. skills/my-skill/my-skill.json)
-    skill_dirs = [p for p in SKILLS_DIR.iterdir() if p.is_dir()]
-
     # Fallback: allow legacy JSON files directly in SKILLS_DIR (kept for compatibility)
-    legacy_jsons = list(SKILLS_DIR.glob("*.json"))
+    try:
+        skill_dirs, legacy_jsons = scan_dir(SKILLS_DIR)
+    except FileNotFoundError:
+        log.warning("Skills directory not found: %s", SKILLS_DIR)
+        return
+
+    log.info("\n=== Compiling All Skills ===")
 
     total = len(skill_dirs) + len(legacy_jsons)
     if total == 0:
-        print("No skills found.")
+        log.info("No skills found.")
         return
 
-    success_count = 0
+    skill_files = []
 
-    # Compile skills found as subdirectories
+    # Collect skills found as subdirectories
     for sd in skill_dirs:
         # Prefer <skilldir>/<skilldir>.json or the first .json found inside the directory
-        json_candidates = list(sd.glob("*.json"))
+        json_candidates = list_json_files(sd)
         if not json_candidates:
-            print(f"  Skipping {sd.name}: no .json descriptor found inside directory")
+            log.warning(
+                "  Skipping %s: no .json descriptor found inside directory", sd.name
+            )
             continue
         preferred = sd / f"{sd.name}.json"
-        if preferred.exists():
-            skill_file = preferred
+        if preferred in json_candidates:
+            skill_files.append(preferred)
         else:
-            skill_file = json_candidates[0]
-
-        # compile_skill expects a Path to the JSON file; pass it through
-        if compile_skill(skill_file, providers):
-            success_count += 1
+            skill_files.append(json_candidates[0])
 
-    # Compile legacy json files located directly in SKILLS_DIR
-    for skill_file in legacy_jsons:
-        if compile_skill(skill_file, providers):
-            success_count += 1
+    # Legacy json files located directly in SKILLS_DIR
+    skill_files.extend(legacy_jsons)
 
-    print(f"\n✓ Compiled {success_count}/{total} skills")
+    success_count = 0
+    schema = load_schema("skill.schema.json")
+    batch_stamp = _batch_stamp("skills", "skill.schema.json", providers)
+    stamps = {
+        # Directory-layout skills also depend on the artifacts they copy
+        f: _entity_stamp(f, batch_stamp, f.parent if f.parent != SKILLS_DIR else None)
+        for f in skill_files
+    }
+    stale = _plan_build(skill_files, stamps, cache, force)
+    # The copy threads start on first use, after render_all has forked its
+    # worker processes.
+    with ThreadPoolExecutor(max_workers=jobs) as writer:
+        results = render_all(render_skill, stale, providers, schema, executor)
+        for skill_file, result in zip(stale, results):
+            if write_skill(result, writer):
+                success_count += 1
+                name, rendered = result
+                outputs = [
+                    f"{_PROV_SKILLS_DIR[p]}/{name}/SKILL.md" for p, _ in rendered
+                ]
+                _record_build(cache, skill_file, stamps[skill_file], outputs)
+
+    flush_manifests()
+    up_to_date = len(skill_files) - len(stale)
+    log.info(
+        "\n✓ Compiled %d/%d skills%s",
+        success_count,
+        total - up_to_date,
+        _summary_suffix(up_to_date),
+    )
 
 
 def validate_all():
     """Validate all agents and skills without compiling."""
-    print("\n=== Validating All Configurations ===")
+    log.info("\n=== Validating All Configurations ===")
 
     all_valid = True
 
     # Validate agents
-    if AGENTS_DIR.exists():
+    try:
+        agent_files = list_json_files(AGENTS_DIR)
+    except FileNotFoundError:
+        agent_files = []
+    if agent_files:
         agent_schema = load_schema("agent.schema.json")
-        for agent_file in AGENTS_DIR.glob("*.json"):
+        for agent_file in agent_files:
             try:
-                agent_data = json.loads(agent_file.read_text())
+                agent_data = load_json(agent_file)
                 if validate_json(agent_data, agent_schema):
-                    print(f"✓ {agent_file.name}")
+                    log.info("✓ %s", agent_file.name)
                 else:
-                    print(f"✗ {agent_file.name}")
+                    log.error("✗ %s", agent_file.name)
                     all_valid = False
             except json.JSONDecodeError as e:
-                print(f"✗ {agent_file.name} - JSON error: {e}")
+                log.error("✗ %s - JSON error: %s", agent_file.name, e)
                 all_valid = False
 
     # Validate skills
-    if SKILLS_DIR.exists():
+    try:
+        skill_files = list_json_files(SKILLS_DIR)
+    except FileNotFoundError:
+        skill_files = []
+    if skill_files:
         skill_schema = load_schema("skill.schema.json")
-        for skill_file in SKILLS_DIR.glob("*.json"):
+        for skill_file in skill_files:
             try:
-                skill_data = json.loads(skill_file.read_text())
+                skill_data = load_json(skill_file)
                 if validate_json(skill_data, skill_schema):
-                    print(f"✓ {skill_file.name}")
+                    log.info("✓ %s", skill_file.name)
                 else:
-                    print(f"✗ {skill_file.name}")
+                    log.error("✗ %s", skill_file.name)
                     all_valid = False
             except json.JSONDecodeError as e:
-                print(f"✗ {skill_file.name} - JSON error: {e}")
+                log.error("✗ %s - JSON error: %s", skill_file.name, e)
                 all_valid = False
 
     if all_valid:
-        print("\n✓ All configurations are valid")
+        log.info("\n✓ All configurations are valid")
     else:
-        print("\n✗ Some configurations have errors")
+        log.error("\n✗ Some configurations have errors")
 
     return all_valid
 
@@ -635,8 +1492,34 @@ Examples:
     parser.add_argument(
         "--validate", action="store_true", help="Validate without compiling"
     )
+    parser.add_argument(
+        "--jobs",
+        metavar="N",
+        type=int,
+        default=_DEFAULT_JOBS,
+        help=f"Threads used to write and copy output files (default: {_DEFAULT_JOBS})",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Also log every written, unchanged and copied file",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Recompile everything, even entities whose inputs are unchanged",
+    )
 
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    # Progress is logged per written file; block-buffer stdout even on a
+    # terminal so it goes out in a few large writes (flushed at exit).
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+    configure_logging(args.verbose)
 
     # Validate mode
     if args.validate:
@@ -658,21 +1541,26 @@ Examples:
 
     providers = args.provider
 
-    # Compile specific agent
+    # Compile specific agent. The file is opened straight away (no exists()
+    # probe); the parsed data is handed to compile_* so it is read only once.
     if args.agent:
         agent_file = AGENTS_DIR / f"{args.agent}.json"
-        if not agent_file.exists():
-            print(f"Error: Agent not found: {agent_file}")
+        try:
+            agent_data = load_json(agent_file)
+        except FileNotFoundError:
+            log.error("Error: Agent not found: %s", agent_file)
             sys.exit(1)
-        compile_agent(agent_file, providers)
+        compile_agent(agent_file, providers, agent_data=agent_data)
         return
 
     if args.command:
         command_file = COMMANDS_DIR / f"{args.command}.json"
-        if not command_file.exists():
-            print(f"Error: Command not found: {command_file}")
+        try:
+            command_data = load_json(command_file)
+        except FileNotFoundError:
+            log.error("Error: Command not found: %s", command_file)
             sys.exit(1)
-        compile_command(command_file, providers)
+        compile_command(command_file, providers, command_data=command_data)
         return
 
     # Compile specific skill
@@ -681,27 +1569,33 @@ Examples:
         # 1) legacy: skills/<skill>.json
         # 2) new: skills/<skill>/<skill>.json
         skill_file = SKILLS_DIR / f"{args.skill}.json"
-        if not skill_file.exists():
-            alt = SKILLS_DIR / args.skill / f"{args.skill}.json"
-            if alt.exists():
-                skill_file = alt
-            else:
-                print(f"Error: Skill not found: {skill_file} or {alt}")
-                sys.exit(1)
-        compile_skill(skill_file, providers)
-        return
+        alt = SKILLS_DIR / args.skill / f"{args.skill}.json"
+        for candidate in (skill_file, alt):
+            try:
+                skill_data = load_json(candidate)
+            except FileNotFoundError:
+                continue
+            compile_skill(candidate, providers, skill_data=skill_data)
+            return
+        log.error("Error: Skill not found: %s or %s", skill_file, alt)
+        sys.exit(1)
 
-    # Compile all
-    if args.all or args.agents_only:
-        compile_all_agents(providers)
+    # Compile all; the batches share one process pool, whose workers are only
+    # started once a batch is large enough to render in parallel. Entities whose
+    # inputs are unchanged since the last run are skipped unless --force.
+    cache = load_build_cache()
+    with ProcessPoolExecutor() as executor:
+        if args.all or args.agents_only:
+            compile_all_agents(providers, executor, args.jobs, cache, args.force)
 
-    if args.all or args.commands_only:
-        compile_all_commands(providers)
+        if args.all or args.commands_only:
+            compile_all_commands(providers, executor, args.jobs, cache, args.force)
 
-    if args.all or args.skills_only:
-        compile_all_skills(providers)
+        if args.all or args.skills_only:
+            compile_all_skills(providers, executor, args.jobs, cache, args.force)
+    save_build_cache(cache)
 
-    print("\n=== Compilation Complete ===")
+    log.info("\n=== Compilation Complete ===")
 
 
 if __name__ == "__main__":
@@ -32,3 +32,128 @@ def test_compile_entity_basic(tmp_path):
     )
     assert isinstance(out, str)
     assert "model:" in out or "claude-2" in out
+
+
+def test_compile_template_matches_substitute():
+    from string import Template
+
+    text = "a: ${a}\n$b {literal} $$5 'q' \"dq\"\n"
+    ctx = {"a": "x", "b": "y"}
+    render = compile_mod.compile_template(text)
+    assert render(ctx) == Template(text).substitute(ctx)
+    assert render.keys == {"a", "b"}
+    assert compile_mod.compile_template("")({}) == ""
+    with pytest.raises(KeyError):
+        render({"a": "x"})
+    with pytest.raises(ValueError):
+        compile_mod.compile_template("bad $ placeholder")
+
+
+def test_enabled_providers_filters_disabled_and_unknown():
+    entity = {"providers": {"opencode": False}}
+    providers = ("claude", "opencode", "copilot", "gemini")
+    assert compile_mod.enabled_providers(entity, providers) == ["claude", "copilot"]
+    assert compile_mod.enabled_providers({}, ("copilot",)) == ["copilot"]
+
+
+def test_write_if_changed_skips_identical_content(tmp_path):
+    out = tmp_path / "out.md"
+    assert compile_mod.write_if_changed(out, "a\n") is True
+    assert compile_mod.write_if_changed(out, "a\n") is False
+    assert compile_mod.write_if_changed(out, "b\n") is True
+    assert out.read_text() == "b\n"
+
+
+def test_format_mcp_servers_copilot_nested():
+    servers = {
+        "gh": {
+            "command": "npx",
+            "args": ["-y", "server"],
+            "env": {"TOKEN": "x", "extra": {"debug": True}},
+        }
+    }
+    assert compile_mod.format_mcp_servers_copilot(servers) == (
+        "mcpServers:\n"
+        "  gh:\n"
+        "    command: npx\n"
+        "    args:\n"
+        "      - -y\n"
+        "      - server\n"
+        "    env:\n"
+        "      TOKEN: x\n"
+        "      extra:\n"
+        "        debug: True\n"
+    )
+
+
+def test_validate_json_reports_missing_required_field():
+    schema = compile_mod.load_schema("agent.schema.json")
+    assert compile_mod.validate_json({"name": "a", "description": "d"}, schema)
+    assert not compile_mod.validate_json({"name": "a"}, schema)
+
+
+def test_validate_json_does_not_modify_data():
+    schema = compile_mod.load_schema("agent.schema.json")
+    data = {"name": "a", "description": "d", "providers": {"copilot": False}}
+    assert compile_mod.validate_json(data, schema)
+    assert data == {"name": "a", "description": "d", "providers": {"copilot": False}}
+
+
+def test_templates_and_schemas_are_loaded_once():
+    render = compile_mod.load_template("claude.md.j2", template_type="agents")
+    assert compile_mod.load_template("claude.md.j2", template_type="agents") is render
+    schema = compile_mod.load_schema("agent.schema.json")
+    assert compile_mod.load_schema("agent.schema.json") is schema
+    assert schema.required == ("name", "description")
+
+
+def test_flush_manifests_merges_whole_lines(tmp_path):
+    manifest = tmp_path / "manifest.txt"
+    manifest.write_text("my-agent\n")
+    compile_mod._add_manifest_entry(manifest, "agent")
+    compile_mod._add_manifest_entry(manifest, "my-agent")
+    compile_mod.flush_manifests()
+    assert manifest.read_text() == "agent\nmy-agent\n"
+
+
+def test_plan_build_skips_unchanged_entities(tmp_path, monkeypatch):
+    monkeypatch.setattr(compile_mod, "BASE_DIR", tmp_path)
+    source = tmp_path / "a.json"
+    output = tmp_path / "a.md"
+    source.write_text("{}")
+    output.write_text("out")
+
+    stamps = {source: compile_mod._entity_stamp(source, {})}
+    cache = {}
+    assert compile_mod._plan_build([source], stamps, cache) == [source]
+    compile_mod._record_build(cache, source, stamps[source], [str(output)])
+    assert compile_mod._plan_build([source], stamps, cache) == []
+    assert compile_mod._plan_build([source], stamps, cache, force=True) == [source]
+
+    output.unlink()
+    assert compile_mod._plan_build([source], stamps, cache) == [source]
+
+
+def test_skill_outputs_never_write_through_to_linked_sources(tmp_path, monkeypatch):
+    skills = tmp_path / "skills"
+    src = skills / "my-skill"
+    src.mkdir(parents=True)
+    (src / "SKILL.md").write_text("source skill\n")
+    (src / "manifest.txt").write_text("source manifest\n")
+    out = tmp_path / "out"
+    monkeypatch.setattr(compile_mod, "SKILLS_DIR", skills)
+    monkeypatch.setattr(compile_mod, "_PROV_SKILLS_DIR", {"claude": str(out)})
+    monkeypatch.setattr(compile_mod, "_PENDING_MANIFESTS", {})
+
+    for _ in range(2):
+        compile_mod.write_skill_output("my-skill", "compiled\n", "claude")
+        compile_mod.flush_manifests()
+
+    assert (src / "SKILL.md").read_text() == "source skill\n"
+    assert (src / "manifest.txt").read_text() == "source manifest\n"
+    assert (out / "my-skill" / "manifest.txt").read_text() != "source manifest\n"
+
+
+def test_format_tools_distinguishes_tuple_from_list():
+    assert compile_mod.format_tools_claude(("read",)) == ""
+    assert compile_mod.format_tools_claude(["read"]) == "tools: [Read]\n"